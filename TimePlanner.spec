@@ -3,7 +3,7 @@ from PyInstaller.utils.hooks import collect_all
 
 datas = [('*.docx', '.'), ('lang', 'lang')]
 binaries = []
-hiddenimports = ['pandas', 'openpyxl', 'PyQt5.QtWidgets', 'PyQt5.QtGui', 'PyQt5.QtCore', 'docx', 'docx.shared', 'colorsys', 'json', 'datetime']
+hiddenimports = ['openpyxl', 'PyQt5.QtWidgets', 'PyQt5.QtGui', 'PyQt5.QtCore', 'docx', 'docx.shared', 'colorsys', 'json', 'datetime']
 tmp_ret = collect_all('PyQt5')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
@@ -83,7 +83,6 @@ Write-Host ""
 Write-Host "Installing/updating Python packages..." -ForegroundColor Yellow
 $packages = @(
     "PyQt5",
-    "pandas", 
     "openpyxl", 
     "python-docx", 
     "pyinstaller", 
@@ -159,7 +158,6 @@ $pyinstallerArgs = @(
     "--onefile",
     "--windowed",
     "--name=$exeName",
-    "--hidden-import=pandas",
     "--hidden-import=openpyxl",
     "--hidden-import=PyQt5.QtWidgets",
     "--hidden-import=PyQt5.QtGui",
@@ -117,7 +117,6 @@ $pyinstallerArgs = @(
     "--onefile",
     "--windowed",
     "--name=TimePlanner",
-    "--hidden-import=pandas",
     "--hidden-import=openpyxl",
     "--hidden-import=PyQt5.QtWidgets",
     "--hidden-import=PyQt5.QtGui",
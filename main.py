@@ -1,16 +1,25 @@
 import sys
+import io
 import json
 import os
+import colorsys
+import re
+from bisect import bisect_right
+from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate, chain
+from pathlib import Path
 
 # PyQt5 imports - grouped by module
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QInputDialog, QLabel,
     QMenuBar, QAction, QFileDialog, QMessageBox, QDialog, QFormLayout, QLineEdit, 
-    QSpinBox, QTextEdit, QComboBox, QMenu
+    QSpinBox, QTextEdit, QComboBox, QMenu, QStatusBar
 )
-from PyQt5.QtGui import QPainter, QColor, QPen, QFont
-from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPen, QFont, QFontMetricsF, QImage, QImageWriter, QPixmap
+from PyQt5.QtCore import Qt, QEvent, QLine, QRectF, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 # Version information
 try:
@@ -27,13 +36,50 @@ from translation import tr, init_translation_system, change_language
 _current_app_instance = None
 
 # Lazy imports for optional dependencies
-def _import_pandas():
+@lru_cache(maxsize=None)
+def _import_openpyxl():
     try:
-        import pandas as pd
-        return pd
+        import openpyxl
+        return openpyxl
     except ImportError:
-        raise ImportError("pandas is required for Excel operations")
+        raise ImportError("openpyxl is required for Excel operations")
 
+def _write_xlsx(path, sheet_name, header, rows):
+    """Write a header and rows to a new workbook without building a DataFrame
+    
+    Prefers xlsxwriter's streaming mode when installed, otherwise uses a
+    write-only openpyxl workbook.
+    """
+    try:
+        import xlsxwriter  # optional, see requirements.txt
+        from xlsxwriter.exceptions import FileCreateError
+    except ImportError:
+        xlsxwriter = None
+    
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, header)
+        for row_idx, row in enumerate(rows, 1):
+            worksheet.write_row(row_idx, 0, row)
+        # The file is only created on close(); xlsxwriter wraps the OSError from open(),
+        # re-raise it so a locked file, a missing folder etc. surface as with openpyxl
+        try:
+            workbook.close()
+        except FileCreateError as e:
+            if e.args and isinstance(e.args[0], OSError):
+                raise e.args[0] from e
+            raise
+        return
+    
+    workbook = _import_openpyxl().Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_name)
+    worksheet.append(header)
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(path)
+
+@lru_cache(maxsize=None)
 def _import_docx():
     try:
         from docx import Document
@@ -42,33 +88,107 @@ def _import_docx():
         raise ImportError("python-docx is required for Word document operations")
 
 
-# Optimized color generation with caching
-import colorsys
+@lru_cache(maxsize=None)
+def _docx_font_size():
+    """Font size used for exported DOCX text (Length values are immutable ints)"""
+    from docx.shared import Pt
+    return Pt(14)
+
+def _preload_optional_modules():
+    """Import the Excel and Word libraries before the first menu click needs them"""
+    for loader in (_import_openpyxl, _import_docx, _docx_font_size):
+        try:
+            loader()
+        except ImportError:
+            pass  # reported by the menu action that actually needs the library
+
+# Raw bytes of DOCX templates: path -> (st_mtime_ns, bytes)
+_template_cache = {}
+
+def _read_template_bytes(path):
+    """Read a template file once and reuse its bytes until it changes on disk"""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _template_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, 'rb') as f:
+            cached = _template_cache[path] = (mtime, f.read())
+    return cached[1]
+
+# Matches {{Placeholder}} tokens in DOCX templates
+_PLACEHOLDER_RE = re.compile(r'\{\{[^{}]+\}\}')
+
+# Filename sanitizing: characters Windows rejects are dropped, every other run
+# of non-word characters (spaces and hyphens included) becomes a single hyphen
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_FILENAME_SEPARATOR_RE = re.compile(r'[^\w.]+')
+
 
+# Optimized color generation with caching
 # Pre-computed golden angle for color harmony
 GOLDEN_ANGLE = 137.508
-_color_cache = {}
 
-def get_nice_color(idx):
-    """Generate harmonious colors with caching for better performance"""
-    if idx in _color_cache:
-        return _color_cache[idx]
-    
+@lru_cache(maxsize=512)
+def _compute_rgb(idx):
+    """Compute the palette RGB triple for an index (memoized)"""
     hue = (idx * GOLDEN_ANGLE) % 360
     rgb = colorsys.hsv_to_rgb(hue/360, 0.5, 0.95)
-    color = QColor(int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
+    return int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255)
+
+def get_nice_color(idx):
+    """Generate harmonious colors with caching for better performance
     
-    # Cache for future use
-    _color_cache[idx] = color
-    return color
+    Only the RGB values are cached; every caller gets its own QColor so a
+    mutated color can never leak into other sections.
+    """
+    r, g, b = _compute_rgb(idx)
+    return QColor(r, g, b)
+
+def cumulative_starts(durations):
+    """Start minute of each duration when laid out back to back"""
+    return list(accumulate(chain((0,), durations)))[:-1]
+
+def combine_tools(sections):
+    """Merge the tool lists of all sections, keeping the largest quantity per tool
+    
+    Example: "3 Balls", "6 Balls", "12 Balls" -> "12 Balls"
+    """
+    tool_quantities = {}  # tool_name -> max_quantity
+    
+    for section in sections:
+        if not section.tools:
+            continue
+        
+        for tool in section.tools.split(','):
+            # "12 Balls" -> ["12", "Balls"]; plain string ops instead of a regex per tool
+            parts = tool.split(None, 1)
+            if not parts:
+                continue
+            
+            if len(parts) == 2 and parts[0].isdecimal():
+                tool_name = parts[1].strip()
+                tool_quantities[tool_name] = max(tool_quantities.get(tool_name, 0), int(parts[0]))
+            else:
+                # No quantity found, treat as single item (0 means no quantity shown)
+                tool_quantities.setdefault(tool.strip(), 0)
+    
+    if not tool_quantities:
+        return tr('docx_no_tools')
+    
+    return ', '.join(f"{quantity} {tool_name}" if quantity > 0 else tool_name
+                     for tool_name, quantity in sorted(tool_quantities.items()))
+
+# Parsed settings files keyed by (path, st_mtime_ns), shared by all AppSettings instances
+_settings_cache = {}
 
 class AppSettings:
     """Optimized application settings with lazy loading and better error handling"""
-    __slots__ = ('_user_name', '_player_number', '_requirements', '_team', '_language', 'settings_file', '_loaded')
+    __slots__ = ('_user_name', '_player_number', '_requirements', '_team', '_language', 'settings_file', '_loaded',
+                 '_last_saved')
     
     def __init__(self):
         self.settings_file = "settings.json"
         self._loaded = False
+        self._last_saved = None  # settings as last read from or written to disk
         # Initialize with defaults
         self._user_name = None
         self._player_number = None
@@ -84,17 +204,23 @@ class AppSettings:
     
     def _load_settings(self):
         """Load settings from file with proper error handling"""
-        if not os.path.exists(self.settings_file):
+        path = Path(self.settings_file)
+        try:
+            key = (self.settings_file, path.stat().st_mtime_ns)
+        except OSError:
             return
         
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._user_name = data.get('user_name')
-                self._player_number = data.get('player_number')
-                self._requirements = data.get('requirements')
-                self._team = data.get('team')
-                self._language = data.get('language')
+            data = _settings_cache.get(key)
+            if data is None:
+                data = json.loads(path.read_text(encoding='utf-8'))
+                _settings_cache[key] = data
+            self._user_name = data.get('user_name')
+            self._player_number = data.get('player_number')
+            self._requirements = data.get('requirements')
+            self._team = data.get('team')
+            self._language = data.get('language')
+            self._last_saved = self._as_dict()
         except (json.JSONDecodeError, FileNotFoundError, PermissionError) as e:
             print(f"Warning: Could not load settings: {e}")
     
@@ -151,20 +277,34 @@ class AppSettings:
     def save_settings(self):
         """Save settings with proper error handling"""
         self._ensure_loaded()
+        data = self._as_dict()
+        # Nothing changed since the last load or save: leave the file alone
+        if data == self._last_saved and os.path.exists(self.settings_file):
+            return True
         try:
-            data = {
-                'user_name': self._user_name,
-                'player_number': self._player_number,
-                'requirements': self._requirements,
-                'team': self._team,
-                'language': self._language
-            }
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Serialize in memory and swap the file in atomically, so a failed
+            # write can never leave a truncated settings.json behind
+            path = Path(self.settings_file)
+            tmp_path = path.with_name(path.name + '.tmp')
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+            tmp_path.replace(path)
+            # Write through so the next instance skips re-parsing what we just wrote
+            _settings_cache[(self.settings_file, path.stat().st_mtime_ns)] = data
         except (PermissionError, OSError) as e:
             print(f"Warning: Could not save settings: {e}")
             return False
+        self._last_saved = data
         return True
+    
+    def _as_dict(self):
+        """Settings as they are stored in settings.json"""
+        return {
+            'user_name': self._user_name,
+            'player_number': self._player_number,
+            'requirements': self._requirements,
+            'team': self._team,
+            'language': self._language
+        }
 
 
 class SettingsDialog(QDialog):
@@ -179,60 +319,84 @@ class SettingsDialog(QDialog):
         
         layout = QFormLayout()
         
+        # Row labels are kept so a language change can relabel them in place
+        self._row_labels = {key: QLabel() for key in (
+            "settings_trainer_name", "settings_player_count", "settings_requirements",
+            "settings_team_info", "settings_language")}
+        
         # User name
         self.name_edit = QLineEdit(settings.user_name)
-        layout.addRow(tr("settings_trainer_name"), self.name_edit)
+        layout.addRow(self._row_labels["settings_trainer_name"], self.name_edit)
         
         # Player number
         self.player_spin = QSpinBox()
         self.player_spin.setRange(1, 100)
         self.player_spin.setValue(settings.player_number)
-        layout.addRow(tr("settings_player_count"), self.player_spin)
+        layout.addRow(self._row_labels["settings_player_count"], self.player_spin)
         
         # Requirements
         self.requirements_edit = QTextEdit(settings.requirements)
         self.requirements_edit.setMaximumHeight(80)
-        layout.addRow(tr("settings_requirements"), self.requirements_edit)
+        layout.addRow(self._row_labels["settings_requirements"], self.requirements_edit)
         
         # Team info
         self.team_edit = QTextEdit(settings.team)
         self.team_edit.setMaximumHeight(80)
-        layout.addRow(tr("settings_team_info"), self.team_edit)
+        layout.addRow(self._row_labels["settings_team_info"], self.team_edit)
         
         # Language selection
         self.language_combo = QComboBox()
-        self.language_combo.addItem(tr("language_german"), "de-de")
-        self.language_combo.addItem(tr("language_english"), "en-us")
+        self.language_combo.addItem("", "de-de")
+        self.language_combo.addItem("", "en-us")
         # Set current language
         current_index = self.language_combo.findData(settings.language)
         if current_index >= 0:
             self.language_combo.setCurrentIndex(current_index)
-        layout.addRow(tr("settings_language"), self.language_combo)
+        layout.addRow(self._row_labels["settings_language"], self.language_combo)
         
         # Buttons
         button_layout = QHBoxLayout()
-        ok_button = QPushButton(tr("button_ok"))
-        cancel_button = QPushButton(tr("button_cancel"))
+        self.ok_button = QPushButton()
+        self.cancel_button = QPushButton()
         
-        ok_button.clicked.connect(self.accept)
-        cancel_button.clicked.connect(self.reject)
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button.clicked.connect(self.reject)
         
-        button_layout.addWidget(ok_button)
-        button_layout.addWidget(cancel_button)
+        button_layout.addWidget(self.ok_button)
+        button_layout.addWidget(self.cancel_button)
         
         layout.addRow(button_layout)
         self.setLayout(layout)
+        
+        self.refresh_ui()
+        
+        # Snapshot of the shown values; OK without edits skips saving entirely
+        self._initial = self._current_values()
+    
+    def _current_values(self):
+        return (
+            self.name_edit.text().strip(),
+            self.player_spin.value(),
+            self.requirements_edit.toPlainText().strip(),
+            self.team_edit.toPlainText().strip(),
+            self.language_combo.currentData()
+        )
     
     def accept(self):
+        values = self._current_values()
+        if values == self._initial:
+            super().accept()
+            return
+        
         # Check if language changed
         old_language = self.settings.language
-        new_language = self.language_combo.currentData()
+        user_name, player_number, requirements, team, new_language = values
         
         # Save the values back to settings
-        self.settings.user_name = self.name_edit.text().strip()
-        self.settings.player_number = self.player_spin.value()
-        self.settings.requirements = self.requirements_edit.toPlainText().strip()
-        self.settings.team = self.team_edit.toPlainText().strip()
+        self.settings.user_name = user_name
+        self.settings.player_number = player_number
+        self.settings.requirements = requirements
+        self.settings.team = team
         self.settings.language = new_language
         self.settings.save_settings()
         
@@ -244,7 +408,6 @@ class SettingsDialog(QDialog):
             if _current_app_instance:
                 _current_app_instance.update_all_ui()
             # Show message to user that language was changed
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.information(self, tr("settings_title"), tr("language_changed_dynamic_message"))
         
         super().accept()
@@ -256,68 +419,33 @@ class SettingsDialog(QDialog):
         self.refresh_ui()
     
     def refresh_ui(self):
-        """Refresh the UI elements with new translations"""
-        # Get current values
-        current_name = self.name_edit.text()
-        current_players = self.player_spin.value()
-        current_requirements = self.requirements_edit.toPlainText()
-        current_team = self.team_edit.toPlainText()
-        current_language = self.language_combo.currentData()
-        
-        # Clear and rebuild layout
-        old_layout = self.layout()
-        if old_layout:
-            while old_layout.count():
-                child = old_layout.takeAt(0)
-                if child and child.widget():
-                    child.widget().deleteLater()
-        
-        # Rebuild layout with new translations
-        layout = QFormLayout()
-        
-        # User name
-        self.name_edit = QLineEdit(current_name)
-        layout.addRow(tr("settings_trainer_name"), self.name_edit)
-        
-        # Player number
-        self.player_spin = QSpinBox()
-        self.player_spin.setRange(1, 100)
-        self.player_spin.setValue(current_players)
-        layout.addRow(tr("settings_player_count"), self.player_spin)
-        
-        # Requirements
-        self.requirements_edit = QTextEdit(current_requirements)
-        self.requirements_edit.setMaximumHeight(80)
-        layout.addRow(tr("settings_requirements"), self.requirements_edit)
-        
-        # Team info
-        self.team_edit = QTextEdit(current_team)
-        self.team_edit.setMaximumHeight(80)
-        layout.addRow(tr("settings_team_info"), self.team_edit)
-        
-        # Language selection
-        self.language_combo = QComboBox()
-        self.language_combo.addItem(tr("language_german"), "de-de")
-        self.language_combo.addItem(tr("language_english"), "en-us")
-        # Set current language
-        current_index = self.language_combo.findData(current_language)
-        if current_index >= 0:
-            self.language_combo.setCurrentIndex(current_index)
-        layout.addRow(tr("settings_language"), self.language_combo)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        ok_button = QPushButton(tr("button_ok"))
-        cancel_button = QPushButton(tr("button_cancel"))
-        
-        ok_button.clicked.connect(self.accept)
-        cancel_button.clicked.connect(self.reject)
-        
-        button_layout.addWidget(ok_button)
-        button_layout.addWidget(cancel_button)
-        
-        layout.addRow(button_layout)
-        self.setLayout(layout)
+        """Set all user-visible texts from the current translations, keeping the widgets"""
+        for key, label in self._row_labels.items():
+            label.setText(tr(key))
+        self.language_combo.setItemText(self.language_combo.findData("de-de"), tr("language_german"))
+        self.language_combo.setItemText(self.language_combo.findData("en-us"), tr("language_english"))
+        self.ok_button.setText(tr("button_ok"))
+        self.cancel_button.setText(tr("button_cancel"))
+
+
+def _check_section_name(name_edit):
+    """Return True if the section name is filled in, otherwise flag the field"""
+    if name_edit.text().strip():
+        return True
+    
+    # Emptied so the placeholder shows the hint right inside the field
+    name_edit.clear()
+    name_edit.setPlaceholderText(tr("error_empty_section_name"))
+    name_edit.setStyleSheet("border: 1px solid #ff6b6b;")
+    name_edit.setFocus()
+    
+    # Back to normal as soon as the user starts typing
+    def reset():
+        name_edit.textChanged.disconnect(reset)
+        name_edit.setStyleSheet("")
+        name_edit.setPlaceholderText("")
+    name_edit.textChanged.connect(reset)
+    return False
 
 
 class AddSectionDialog(QDialog):
@@ -370,6 +498,11 @@ class AddSectionDialog(QDialog):
         layout.addRow(button_layout)
         self.setLayout(layout)
     
+    def accept(self):
+        # Keep the dialog open until the section has a name
+        if _check_section_name(self.name_edit):
+            super().accept()
+    
     def get_values(self):
         return {
             'name': self.name_edit.text().strip(),
@@ -458,6 +591,11 @@ class EditSectionDialog(QDialog):
             self.delete_requested = True
             self.accept()
     
+    def accept(self):
+        # Deleting needs no valid name; saving keeps the dialog open until there is one
+        if self.delete_requested or _check_section_name(self.name_edit):
+            super().accept()
+    
     def get_values(self):
         return {
             'name': self.name_edit.text().strip(),
@@ -473,8 +611,8 @@ class TimeSection:
     __slots__ = ('start', 'duration', 'name', 'color', 'organisation', 'explanation', 'tools')
     
     def __init__(self, start, duration, name, color, organisation=None, explanation="", tools=""):
-        self.start = start  # in minutes
-        self.duration = duration  # in minutes
+        self.start = start  # in whole minutes
+        self.duration = duration  # in whole minutes
         self.name = name
         self.color = color
         self.organisation = organisation if organisation is not None else tr("organization_exercise")
@@ -492,7 +630,7 @@ class TimeSection:
             'start': self.start,
             'duration': self.duration,
             'name': self.name,
-            'color': f'#{self.color.red():02x}{self.color.green():02x}{self.color.blue():02x}',
+            'color': self.color.name(),  # '#rrggbb'
             'organisation': self.organisation,
             'explanation': self.explanation,
             'tools': self.tools
@@ -505,14 +643,18 @@ class BarWidget(QWidget):
     # Class constants for better performance
     MARGIN = 80
     BAR_HEIGHT = 120
+    LABEL_POINT_SIZE = 8
+    MIN_LABEL_WIDTH = 24  # narrower segments get no label at all
+    DRAG_FRAME_MS = 16  # drag repaints are capped at roughly 60 per second
     DASH_LINE_ALPHA = 120
     BACKGROUND_COLOR = QColor(250, 252, 255)
     BAR_COLOR = QColor(230, 235, 245)
     
-    def __init__(self, total_minutes=120, sections=None):
+    def __init__(self, total_minutes=120, sections=None, app=None):
         super().__init__()
         self.total_minutes = total_minutes
         self.sections = sections if sections else []
+        self._app = app  # owning TimePlannerApp, hosts the edit dialog
         self.setMinimumWidth(1300)
         self.setMinimumHeight(340)
         
@@ -522,85 +664,377 @@ class BarWidget(QWidget):
         self._drag_x = None
         self._drag_y = None
         self._drag_section = None
+        self._drag_ghost_color = None  # lightened section color, computed once per drag
+        self._last_ghost_rect = None  # area covered by the ghost at the last repaint
+        self._suppress_update = False  # set while a batch of mutations is running
+        
+        # Single-shot frame timer: all mouse moves within one frame share one repaint
+        self._drag_update_timer = QTimer(self)
+        self._drag_update_timer.setSingleShot(True)
+        self._drag_update_timer.setInterval(self.DRAG_FRAME_MS)
+        self._drag_update_timer.timeout.connect(self._flush_drag_update)
+        
+        # Context menu is built once; the actions act on the section stored in _ctx_idx
+        self._ctx_idx = None
+        self._ctx_menu = QMenu(self)
+        self._edit_action = QAction(self)
+        self._edit_action.triggered.connect(lambda: self.edit_section(self._ctx_idx))
+        self._ctx_menu.addAction(self._edit_action)
+        self._delete_action = QAction(self)
+        self._delete_action.triggered.connect(lambda: self.delete_section(self._ctx_idx))
+        self._ctx_menu.addAction(self._delete_action)
         
         # Performance optimizations
         self.setMouseTracking(True)
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)  # Optimize painting
+        self.setAttribute(Qt.WA_NoSystemBackground, True)  # the cached layer covers every pixel
+        self.setAutoFillBackground(False)
         
         # Pre-create commonly used objects to reduce allocations
         self._dash_pen = QPen(QColor(120, 120, 120, self.DASH_LINE_ALPHA), 1, Qt.DashLine)
         self._text_pen = QPen(QColor(30, 30, 30))
+        self._ghost_pen = QPen(QColor(120, 120, 120, 80), 2, Qt.DashLine)
         self._text_font = QFont()
-        self._text_font.setPointSize(8)
+        self._text_font.setPointSize(self.LABEL_POINT_SIZE)
         self._text_font.setBold(False)
+        self._text_metrics = QFontMetricsF(self._text_font)
         
         # Cache for paint calculations
-        self._last_width = 0
+        self._last_size = None
         self._cached_bar_width = 0
+        self._bar_y = 0
+        self._px_per_minute = 0
+        
+        # Pre-rendered background, bar and non-dragged sections
+        self._bg_cache = None
+        self._bg_cache_size = None
+        self._bg_dirty = True
+        
+        # Background and empty bar alone; only depends on the widget size
+        self._bar_pixmap = None
+        self._bar_pixmap_key = None
+        
+        # Struct-of-arrays view of the sections, kept in sync by the mutation helpers
+        self._starts = []
+        self._durations = []
+        self._colors = []
+        self._edges = []  # cumulative end minute of each section
+        self._midpoints = []  # centre minute of each section (rounded down), used for drop positions
+        self._labels = []  # "Name (N min)" text of each section
+        self._total_used = 0  # sum of all section durations
+        # Pixel bounds derived from the arrays, rebuilt when width or sections change
+        self._x_starts = []
+        self._x_ends = []
+        self._seg_rects = []  # QRectF of each section body
+        self._label_rects = []  # QRectF of each section label
+        self._geometry_valid = False
+        self._sync_sections()
+    
+    def _sync_sections(self):
+        """Rebuild the cached section arrays from self.sections"""
+        sections = self.sections
+        self._starts = [s.start for s in sections]
+        self._durations = [s.duration for s in sections]
+        self._colors = [s.color for s in sections]
+        self._edges = [start + duration for start, duration in zip(self._starts, self._durations)]
+        self._midpoints = [start + duration // 2 for start, duration in zip(self._starts, self._durations)]
+        self._labels = [self._label_text(s) for s in sections]
+        self._total_used = sum(self._durations)
+        self._geometry_valid = False
+        self._bg_dirty = True
+    
+    @property
+    def total_used(self):
+        """Minutes already taken by sections"""
+        return self._total_used
+    
+    @property
+    def remaining_minutes(self):
+        """Minutes still free at the end of the bar"""
+        return self.total_minutes - self._total_used
+    
+    def _ensure_geometry(self):
+        """Compute the pixel bounds of all sections in a single pass"""
+        width = self.width()
+        height = self.height()
+        if (width, height) != self._last_size:
+            self._last_size = (width, height)
+            self._bar_y = height // 2 - self.BAR_HEIGHT // 2
+            self._cached_bar_width = width - 2 * self.MARGIN
+            self._px_per_minute = self._cached_bar_width / self.total_minutes
+            self._geometry_valid = False
+        
+        if not self._geometry_valid:
+            scale = self._px_per_minute
+            margin = self.MARGIN
+            self._x_starts = [margin + start * scale for start in self._starts]
+            self._x_ends = [x + duration * scale for x, duration in zip(self._x_starts, self._durations)]
+            bar_y = self._bar_y
+            bar_height = self.BAR_HEIGHT
+            label_y = bar_y + bar_height + 6
+            self._seg_rects = [QRectF(x_start, bar_y, x_end - x_start, bar_height)
+                               for x_start, x_end in zip(self._x_starts, self._x_ends)]
+            self._label_rects = [QRectF(x_start, label_y, x_end - x_start, 18)
+                                 for x_start, x_end in zip(self._x_starts, self._x_ends)]
+            self._geometry_valid = True
+    
+    def _safe_update(self, rect=None):
+        """Schedule a repaint (of rect, if given) unless a batch of mutations is in progress"""
+        # Qt merges queued update() calls into a single paint event
+        if self._suppress_update:
+            return
+        if rect is None:
+            self.update()
+        else:
+            self.update(rect)
+    
+    @contextmanager
+    def batch(self):
+        """Group several section mutations into a single repaint"""
+        self._suppress_update = True
+        try:
+            yield self
+        finally:
+            self._suppress_update = False
+            self._safe_update()
+    
+    def _reflow(self):
+        """Recompute start times after the order or durations changed"""
+        sections = self.sections
+        starts = cumulative_starts([s.duration for s in sections])
+        for section, start in zip(sections, starts):
+            section.start = start
+        self._sync_sections()
+        self._safe_update()
+    
+    def _reflow_range(self, lo, hi=None):
+        """Recompute start times and cached arrays for sections[lo:hi] only
+        
+        Everything before lo must already be in sync; sections after hi keep
+        their start times, which holds as long as the range's total duration
+        did not change (a reorder inside it, or hi=None for the tail).
+        """
+        sections = self.sections
+        if hi is None:
+            hi = len(sections)
+        cur = self._edges[lo - 1] if lo else 0
+        
+        chunk = sections[lo:hi]
+        durations = [s.duration for s in chunk]
+        starts = [cur + offset for offset in cumulative_starts(durations)]
+        for section, start in zip(chunk, starts):
+            section.start = start
+        
+        self._starts[lo:hi] = starts
+        self._durations[lo:hi] = durations
+        self._colors[lo:hi] = [s.color for s in chunk]
+        self._edges[lo:hi] = [start + duration for start, duration in zip(starts, durations)]
+        self._midpoints[lo:hi] = [start + duration // 2 for start, duration in zip(starts, durations)]
+        self._labels[lo:hi] = [self._label_text(s) for s in chunk]
+        self._total_used = self._edges[-1] if self._edges else 0
+        self._geometry_valid = False
+        self._bg_dirty = True
+    
+    def add_section(self, section):
+        """Append a section to the end of the bar"""
+        # An up-to-date static layer only needs the new section's strip re-rendered
+        can_append = self._bg_cache_current() and self._drag_idx is None
+        self.sections.append(section)
+        self._starts.append(section.start)
+        self._durations.append(section.duration)
+        self._colors.append(section.color)
+        self._edges.append(section.start + section.duration)
+        self._midpoints.append(section.start + section.duration // 2)
+        self._labels.append(self._label_text(section))
+        self._total_used += section.duration
+        self._geometry_valid = False
+        self._ensure_geometry()
+        # Nothing left of the new section changed, so only its strip needs repainting
+        bounds = self._paint_bounds(self._seg_rects[-1])
+        if can_append:
+            # Paint the strip from scratch exactly as a full render would; painting the new
+            # section on top would stroke the shared guide twice and darken it
+            painter = QPainter(self._bg_cache)
+            painter.setClipRect(bounds)
+            painter.drawPixmap(0, 0, self._ensure_bar_pixmap(self.width(), self.height(),
+                                                             self._bg_cache.devicePixelRatioF()))
+            self._paint_sections(painter, self._bar_y)
+            painter.end()
+        else:
+            self._bg_dirty = True
+        self._safe_update(bounds)
+    
+    def move_section(self, from_idx, to_idx):
+        """Move a section to a new position in the bar"""
+        self.sections.insert(to_idx, self.sections.pop(from_idx))
+        # Sections outside the moved span keep their start times
+        lo, hi = sorted((from_idx, to_idx))
+        self._reflow_range(lo, hi + 1)
+        self._safe_update()
+    
+    def remove_section(self, idx):
+        """Remove a section and close the gap it leaves"""
+        self.sections.pop(idx)
+        for cached in (self._starts, self._durations, self._colors, self._edges, self._midpoints,
+                       self._labels):
+            del cached[idx]
+        # Only the sections after the gap move
+        self._reflow_range(idx)
+        self._safe_update()
+    
+    def replace_sections(self, sections):
+        """Replace all sections at once, e.g. after an import"""
+        self.sections = sections
+        self._reflow()
+    
+    def clear_sections(self):
+        """Remove all sections"""
+        self.sections.clear()
+        self._sync_sections()
+        self._safe_update()
+    
+    def sections_changed(self, first=0):
+        """Notify the bar that sections from index first on were edited in place"""
+        # Sections before the first edited one keep their start times
+        self._reflow_range(first)
+        self._safe_update()
 
     def paintEvent(self, event):
-        """Optimized paint event with reduced object creation"""
+        """Blit the cached static layer and draw only the drag ghost on top"""
+        self._ensure_geometry()
+        if not self._bg_cache_current():
+            self._render_static_layer()
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
-        # Cache calculations for performance
-        width = self.width()
-        height = self.height()
+        # Only the region Qt asked for needs to be repainted
+        painter.setClipRegion(event.region())
+        painter.drawPixmap(0, 0, self._bg_cache)
         
-        # Update cached values if width changed
-        if width != self._last_width:
-            self._last_width = width
-            self._cached_bar_width = width - 2 * self.MARGIN
+        # Fast path: without a drag the cached layer is the whole picture
+        if self._drag_idx is None:
+            return
         
-        bar_y = height // 2 - self.BAR_HEIGHT // 2
+        # Exposures away from the ghost (e.g. an uncovered window strip) need only the blit
+        if self._last_ghost_rect is not None and not event.rect().intersects(self._last_ghost_rect):
+            return
         
-        # Background - use cached color
-        painter.setBrush(self.BACKGROUND_COLOR)
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(0, 0, width, height)
+        # Draw dragged segment as ghost
+        painter.setFont(self._text_font)
+        self._paint_dragged_section(painter, self._bar_y)
+    
+    def set_label_scale(self, scale_factor):
+        """Scale the section label font along with the zoom level"""
+        self._text_font.setPointSizeF(self.LABEL_POINT_SIZE * scale_factor)
+        self._text_metrics = QFontMetricsF(self._text_font)
+        self._bg_dirty = True
+        self._safe_update()
+    
+    def resizeEvent(self, event):
+        self._bg_dirty = True
+        super().resizeEvent(event)
+    
+    def _bg_cache_current(self):
+        """True if the static layer is up to date for the current size and pixel ratio"""
+        # A move to a screen with another scale factor keeps the logical size
+        return (not self._bg_dirty and self._bg_cache is not None
+                and self._bg_cache_size == self.size()
+                and self._bg_cache.devicePixelRatioF() == self.devicePixelRatioF())
+    
+    def _render_static_layer(self):
+        """Render everything except the drag ghost into the pixmap cache"""
+        width = self.width()
+        height = self.height()
+        dpr = self.devicePixelRatioF()
         
-        # Main bar - use cached color
-        painter.setBrush(self.BAR_COLOR)
-        painter.drawRoundedRect(self.MARGIN, bar_y, self._cached_bar_width, self.BAR_HEIGHT, 16, 16)
+        # Reuse the pixmap while size and pixel ratio stay the same
+        if (self._bg_cache is None or self._bg_cache_size != self.size()
+                or self._bg_cache.devicePixelRatioF() != dpr):
+            self._bg_cache = QPixmap(int(width * dpr), int(height * dpr))
+            self._bg_cache.setDevicePixelRatio(dpr)
+            self._bg_cache_size = self.size()
         
-        # Set up text rendering once
-        painter.setFont(self._text_font)
+        painter = QPainter(self._bg_cache)
+        
+        # Background and empty bar only change with the widget size
+        painter.drawPixmap(0, 0, self._ensure_bar_pixmap(width, height, dpr))
         
         # Draw segments (except dragged one)
-        self._paint_sections(painter, bar_y, exclude_dragged=True)
+        self._paint_sections(painter, self._bar_y, exclude_dragged=True)
         
-        # Draw dragged segment as ghost
-        self._paint_dragged_section(painter, bar_y)
+        painter.end()
+        self._bg_dirty = False
     
-    def _paint_sections(self, painter, bar_y, exclude_dragged=False):
-        """Efficiently paint sections with minimal object creation"""
-        for idx, section in enumerate(self.sections):
-            if exclude_dragged and self._drag_idx == idx and self._drag_section is not None:
-                continue
+    def _ensure_bar_pixmap(self, width, height, dpr):
+        """Rasterize the background and the empty rounded bar once per size"""
+        key = (width, height, dpr)
+        if self._bar_pixmap is None or self._bar_pixmap_key != key:
+            pixmap = QPixmap(int(width * dpr), int(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(self.BACKGROUND_COLOR)
             
-            # Calculate positions once
-            x_start = self.MARGIN + (section.start / self.total_minutes) * self._cached_bar_width
-            x_end = self.MARGIN + (section.end_time / self.total_minutes) * self._cached_bar_width
-            
-            # Draw segment
-            rect = QRectF(x_start, bar_y, x_end - x_start, self.BAR_HEIGHT)
-            painter.setBrush(section.color)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
             painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(rect, 12, 12)
+            painter.setBrush(self.BAR_COLOR)
+            painter.drawRoundedRect(self.MARGIN, self._bar_y, self._cached_bar_width, self.BAR_HEIGHT, 16, 16)
+            painter.end()
             
-            # Draw dashed lines using pre-created pen
-            painter.setPen(self._dash_pen)
+            self._bar_pixmap = pixmap
+            self._bar_pixmap_key = key
+        return self._bar_pixmap
+    
+    def _paint_sections(self, painter, bar_y, exclude_dragged=False):
+        """
+        Paint sections in three passes (bodies, guides, labels) so that pen,
+        brush and font are bound once per pass instead of once per section
+        """
+        sections = zip(self._labels, self._x_starts, self._x_ends, self._colors,
+                       self._seg_rects, self._label_rects)
+        if exclude_dragged and self._drag_idx is not None and self._drag_section is not None:
+            skip_idx = self._drag_idx
+            visible = [item for idx, item in enumerate(sections) if idx != skip_idx]
+        else:
+            # Common case: nothing is being dragged, no per-section check needed
+            visible = list(sections)
+        if not visible:
+            return
+        
+        # Pass 1: segment bodies, the only pass whose rounded corners need antialiasing
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        # Sections sharing a color (common after an import) go out as one path
+        by_color = {}
+        for _, _, _, color, rect, _ in visible:
+            by_color.setdefault(color.rgba(), (color, []))[1].append(rect)
+        for color, rects in by_color.values():
+            painter.setBrush(color)
+            if len(rects) == 1:
+                painter.drawRoundedRect(rects[0], 12, 12)
+                continue
+            path = QPainterPath()
+            path.setFillRule(Qt.WindingFill)
+            for rect in rects:
+                path.addRoundedRect(rect, 12, 12)
+            painter.drawPath(path)
+        
+        # Pass 2: dashed lines using pre-created pen; pixel-aligned, so no antialiasing
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        line_top = int(bar_y - 8)
+        line_bottom = int(bar_y + self.BAR_HEIGHT + 18)
+        dash_lines = []
+        for _, x_start, x_end, _, _, _ in visible:
             x_start_int, x_end_int = int(x_start), int(x_end)
-            line_top = int(bar_y - 8)
-            line_bottom = int(bar_y + self.BAR_HEIGHT + 18)
-            painter.drawLine(x_start_int, line_top, x_start_int, line_bottom)
-            painter.drawLine(x_end_int, line_top, x_end_int, line_bottom)
-            
-            # Draw text using pre-created pen and font
-            painter.setPen(self._text_pen)
-            text = f"{section.name} ({section.duration} min)"
-            text_rect = QRectF(x_start, bar_y + self.BAR_HEIGHT + 6, x_end - x_start, 18)
-            painter.drawText(text_rect, Qt.AlignCenter, text)
+            dash_lines.append(QLine(x_start_int, line_top, x_start_int, line_bottom))
+            dash_lines.append(QLine(x_end_int, line_top, x_end_int, line_bottom))
+        painter.setPen(self._dash_pen)
+        painter.drawLines(dash_lines)
+        
+        # Pass 3: labels using pre-created pen and font
+        painter.setPen(self._text_pen)
+        painter.setFont(self._text_font)
+        for label, _, _, _, _, label_rect in visible:
+            self._draw_label(painter, label_rect, label)
     
     def _paint_dragged_section(self, painter, bar_y):
         """Paint the dragged section as a ghost"""
@@ -608,29 +1042,52 @@ class BarWidget(QWidget):
                 self._drag_x is not None and self._drag_y is not None):
             return
         
-        drag = self._drag_section
-        drag_width = (drag.duration / self.total_minutes) * self._cached_bar_width
-        rect = QRectF(self._drag_x - self._drag_offset, self._drag_y - self.BAR_HEIGHT // 2, 
-                     drag_width, self.BAR_HEIGHT)
+        rect = self._ghost_rect()
         
         # Ghost section
-        painter.setBrush(drag.color.lighter(120))
-        ghost_pen = QPen(QColor(120, 120, 120, 80), 2, Qt.DashLine)
-        painter.setPen(ghost_pen)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setBrush(self._drag_ghost_color)
+        painter.setPen(self._ghost_pen)
         painter.drawRoundedRect(rect, 12, 12)
         
         # Ghost dashed lines
+        painter.setRenderHint(QPainter.Antialiasing, False)
         painter.setPen(self._dash_pen)
         left_int, right_int = int(rect.left()), int(rect.right())
         top_int, bottom_int = int(rect.top() - 8), int(rect.bottom() + 18)
-        painter.drawLine(left_int, top_int, left_int, bottom_int)
-        painter.drawLine(right_int, top_int, right_int, bottom_int)
+        painter.drawLines([QLine(left_int, top_int, left_int, bottom_int),
+                           QLine(right_int, top_int, right_int, bottom_int)])
         
         # Ghost text
         painter.setPen(self._text_pen)
-        text = f"{drag.name} ({drag.duration} min)"
         text_rect = QRectF(rect.left(), rect.bottom() + 6, rect.width(), 18)
-        painter.drawText(text_rect, Qt.AlignCenter, text)
+        self._draw_label(painter, text_rect, self._labels[self._drag_idx])
+    
+    @staticmethod
+    def _label_text(section):
+        return f"{section.name} ({section.duration} min)"
+    
+    def _draw_label(self, painter, rect, text):
+        """Draw a section label elided to its segment; skip segments too narrow for text"""
+        width = rect.width()
+        if width < self.MIN_LABEL_WIDTH:
+            return
+        painter.drawText(rect, Qt.AlignCenter, self._text_metrics.elidedText(text, Qt.ElideRight, width))
+    
+    def _ghost_rect(self):
+        """Rectangle of the dragged section's ghost body"""
+        drag_width = (self._drag_section.duration / self.total_minutes) * self._cached_bar_width
+        return QRectF(self._drag_x - self._drag_offset, self._drag_y - self.BAR_HEIGHT // 2,
+                      drag_width, self.BAR_HEIGHT)
+    
+    def _ghost_bounds(self):
+        """Widget area touched by the ghost, including its guides and label"""
+        return self._paint_bounds(self._ghost_rect())
+    
+    @staticmethod
+    def _paint_bounds(body_rect):
+        """Widget area touched by a section body, including its guides and label"""
+        return body_rect.adjusted(-2, -10, 2, 26).toAlignedRect()
 
     def mousePressEvent(self, event):
         """Optimized mouse press handling"""
@@ -642,144 +1099,103 @@ class BarWidget(QWidget):
         
         # Use cached values for performance
         x, y = event.x(), event.y()
-        bar_y = self.height() // 2 - self.BAR_HEIGHT // 2
         
         # Find clicked section efficiently
-        clicked_section = self._find_section_at_point(x, y, bar_y)
+        clicked_section = self._find_section_at_point(x, y)
         if clicked_section is not None:
             idx, section = clicked_section
-            x_start = self.MARGIN + (section.start / self.total_minutes) * self._cached_bar_width
             
             self._drag_idx = idx
-            self._drag_offset = x - x_start
+            self._drag_offset = x - self._x_starts[idx]
             self._drag_x = x
             self._drag_y = y
             self._drag_section = section
+            self._drag_ghost_color = section.color.lighter(120)
+            self._last_ghost_rect = self._ghost_bounds()
+            self._bg_dirty = True  # the dragged section leaves the static layer
             self.setCursor(Qt.ClosedHandCursor)
             self.update()
     
-    def _find_section_at_point(self, x, y, bar_y):
-        """Efficiently find section at given point"""
+    def _find_section_at_point(self, x, y):
+        """Find the section at the given point by binary search over the section ends"""
+        self._ensure_geometry()
+        bar_y = self._bar_y
         # Quick bounds check
         if not (self.MARGIN <= x <= self.width() - self.MARGIN and 
                 bar_y <= y <= bar_y + self.BAR_HEIGHT):
             return None
         
-        for idx, section in enumerate(self.sections):
-            x_start = self.MARGIN + (section.start / self.total_minutes) * self._cached_bar_width
-            x_end = self.MARGIN + (section.end_time / self.total_minutes) * self._cached_bar_width
-            
-            if x_start <= x <= x_end:
-                return idx, section
+        minute = self._x_to_minute(x)
+        idx = bisect_right(self._edges, minute)
+        if idx < len(self.sections):
+            return idx, self.sections[idx]
         
         return None
+    
+    def _x_to_minute(self, x):
+        """Map a widget x coordinate to the whole minute of the bar it falls in"""
+        return int((x - self.MARGIN) // self._px_per_minute)
 
     def mouseMoveEvent(self, event):
         if self._drag_idx is not None and self._drag_section is not None:
-            width = self.width()
-            margin = 80
-            bar_height = 120
-            bar_width = width-2*margin
-            x = event.x()
-            y = event.y()
-            self._drag_x = x
-            self._drag_y = y
-            self.setCursor(Qt.ClosedHandCursor)
-            self.update()
+            self._drag_x = event.x()
+            self._drag_y = event.y()
+            # Queue at most one repaint per frame, however fast the mouse reports
+            if not self._drag_update_timer.isActive():
+                self._drag_update_timer.start()
         else:
             # Hover-Effekt
-            width = self.width()
-            margin = 80
-            bar_height = 120
-            bar_width = width-2*margin
-            x = event.x()
-            y = event.y()
-            bar_y = self.height()//2 - bar_height//2
-            hovered = None
-            for idx, section in enumerate(self.sections):
-                x_start = margin + (section.start/self.total_minutes)*bar_width
-                x_end = margin + ((section.start+section.duration)/self.total_minutes)*bar_width
-                rect = QRectF(x_start, bar_y, x_end-x_start, bar_height)
-                if rect.contains(x, y):
-                    hovered = idx
-                    break
+            hovered = self._find_section_at_point(event.x(), event.y())
             if hovered is not None:
                 self.setCursor(Qt.OpenHandCursor)
             else:
                 self.setCursor(Qt.ArrowCursor)
 
+    def _flush_drag_update(self):
+        """Repaint only where the ghost was and where it is now"""
+        ghost_rect = self._ghost_bounds()
+        self.update(ghost_rect.united(self._last_ghost_rect))
+        self._last_ghost_rect = ghost_rect
+
     def mouseReleaseEvent(self, event):
         if self._drag_idx is not None and self._drag_section is not None:
-            width = self.width()
-            margin = 80
-            bar_height = 120
-            bar_width = width-2*margin
-            x = event.x()
-            # Bestimme neue Position im Array anhand Cursor-X
-            rel_x = x - margin
-            total = 0
-            new_pos = 0
-            for i, s in enumerate(self.sections):
-                if i == self._drag_idx:
-                    continue
-                seg_len = (s.duration/self.total_minutes)*bar_width
-                if rel_x < total + seg_len/2:
-                    new_pos = i
-                    break
-                total += seg_len
-            else:
-                new_pos = len(self.sections)-1
-            if new_pos != self._drag_idx:
-                seg = self.sections.pop(self._drag_idx)
-                self.sections.insert(new_pos, seg)
-            # Startzeiten neu berechnen
-            cur = 0
-            for s in self.sections:
-                s.start = cur
-                cur += s.duration
+            self._ensure_geometry()
+            drag_idx = self._drag_idx
+            # Bestimme neue Position im Array anhand Cursor-X:
+            # Anzahl der Abschnitte, deren Mitte links vom Cursor liegt
+            new_pos = bisect_right(self._midpoints, self._x_to_minute(event.x()))
+            if new_pos > drag_idx:
+                new_pos -= 1
             self._drag_idx = None
             self._drag_section = None
+            self._drag_ghost_color = None
             self._drag_x = None
             self._drag_y = None
+            self._last_ghost_rect = None
+            self._drag_update_timer.stop()  # the drop repaints the widget itself
             self.setCursor(Qt.ArrowCursor)
-            self.update()
+            if new_pos != drag_idx:
+                # Startzeiten werden beim Verschieben neu berechnet
+                self.move_section(drag_idx, new_pos)
+            else:
+                self._bg_dirty = True
+                self.update()
 
     def show_context_menu(self, event):
         """Show context menu for right-click on segments"""
-        width = self.width()
-        margin = 80
-        bar_height = 120
-        bar_width = width-2*margin
-        x = event.x()
-        y = event.y()
-        bar_y = self.height()//2 - bar_height//2
-        
         # Find which section was clicked
-        clicked_section = None
-        for idx, section in enumerate(self.sections):
-            x_start = margin + (section.start/self.total_minutes)*bar_width
-            x_end = margin + ((section.start+section.duration)/self.total_minutes)*bar_width
-            rect = QRectF(x_start, bar_y, x_end-x_start, bar_height)
-            if rect.contains(x, y):
-                clicked_section = (idx, section)
-                break
+        clicked_section = self._find_section_at_point(event.x(), event.y())
         
         if clicked_section is None:
             return
         
-        # Create context menu
-        menu = QMenu(self)
-        
-        edit_action = QAction(tr("context_edit"), self)
-        edit_action.triggered.connect(lambda: self.edit_section(clicked_section[0]))
-        menu.addAction(edit_action)
-        
-        delete_action = QAction(tr("context_delete"), self)
-        delete_action.triggered.connect(lambda: self.delete_section(clicked_section[0]))
-        menu.addAction(delete_action)
+        self._ctx_idx = clicked_section[0]
+        # Texts are set per use so a language switch is picked up
+        self._edit_action.setText(tr("context_edit"))
+        self._delete_action.setText(tr("context_delete"))
         
         # Show menu at cursor position
-        menu.exec_(event.globalPos())
+        self._ctx_menu.exec_(event.globalPos())
     
     def edit_section(self, section_idx):
         """Edit a section"""
@@ -789,16 +1205,10 @@ class BarWidget(QWidget):
         section = self.sections[section_idx]
         
         # Calculate available duration (current duration + remaining time)
-        remaining_time = self.total_minutes - sum(s.duration for i, s in enumerate(self.sections) if i != section_idx)
-        max_duration = remaining_time
-        
-        # Get parent TimePlannerApp to access the edit dialog
-        parent = self.parent()
-        while parent and not isinstance(parent, TimePlannerApp):
-            parent = parent.parent()
+        max_duration = self.remaining_minutes + section.duration
         
-        if parent:
-            parent.edit_section_dialog(section, section_idx, max_duration)
+        if self._app is not None:
+            self._app.edit_section_dialog(section, section_idx, max_duration)
     
     def delete_section(self, section_idx):
         """Delete a section with confirmation"""
@@ -814,13 +1224,44 @@ class BarWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.sections.pop(section_idx)
-            # Recalculate start times
-            cur = 0
-            for s in self.sections:
-                s.start = cur
-                cur += s.duration
-            self.update()
+            self.remove_section(section_idx)
+
+
+class _ExcelImportSignals(QObject):
+    finished = pyqtSignal(object)  # list of sections, or None if the sheet has no header
+    failed = pyqtSignal(object)  # the exception raised while reading
+
+
+class ExcelImportWorker(QRunnable):
+    """Read an Excel plan on the thread pool so large files do not freeze the UI"""
+    
+    def __init__(self, path, read_sections):
+        super().__init__()
+        self.path = path
+        self.read_sections = read_sections
+        # Created on the GUI thread, so connected slots run there via queued signals
+        self.signals = _ExcelImportSignals()
+    
+    def run(self):
+        try:
+            openpyxl = _import_openpyxl()
+            # Read-only mode streams rows instead of building the whole cell graph
+            workbook = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+            try:
+                sections = self.read_sections(workbook.active)
+            finally:
+                workbook.close()
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(sections)
+
+
+class _PreloadWorker(QRunnable):
+    """Import the optional libraries on the thread pool, off the GUI thread"""
+    
+    def run(self):
+        _preload_optional_modules()
 
 
 class TimePlannerApp(QWidget):
@@ -869,7 +1310,7 @@ class TimePlannerApp(QWidget):
                 background: #4a6cff;
             }
         """)
-        self.bar = BarWidget(total_minutes=self.total_minutes)
+        self.bar = BarWidget(total_minutes=self.total_minutes, app=self)
         self.title = QLabel(f"{self.plan_name}")
         self.title.setObjectName("titleLabel")
         self.info = QLabel(tr('total_duration_label').format(self.total_minutes//60, self.total_minutes%60, self.total_minutes))
@@ -877,6 +1318,8 @@ class TimePlannerApp(QWidget):
         self.add_btn = QPushButton(tr("add_section_button"))
         self.add_btn.clicked.connect(self.add_section)
         self.scale_factor = 1.0
+        self._import_worker = None  # running ExcelImportWorker, if any
+        self._plan_actions = ()
         # Reset Button
         self.reset_btn = QPushButton(tr("reset_button"))
         self.reset_btn.clicked.connect(self.reset_plan)
@@ -911,6 +1354,9 @@ class TimePlannerApp(QWidget):
         reset_action.setShortcut("Ctrl+R")
         reset_action.triggered.connect(self.reset_plan)
         file_menu.addAction(reset_action)
+        # Actions that replace or change the plan are locked while an import runs
+        self._plan_actions = (import_excel_action, reset_action)
+        self._update_plan_controls()
         file_menu.addSeparator()
         scaler_action = QAction(tr("menu_window_size"), self)
         scaler_action.setShortcut("F11")
@@ -937,6 +1383,9 @@ class TimePlannerApp(QWidget):
         toolbar_row = QHBoxLayout()
         toolbar_row.addWidget(self.add_btn)
         toolbar_row.addStretch(1)
+        # Non-modal feedback for quick validation hints
+        self.status_bar = QStatusBar(self)
+        self.status_bar.setSizeGripEnabled(False)
         layout = QVBoxLayout()
         layout.setContentsMargins(30, 20, 30, 20)
         layout.setSpacing(10)
@@ -945,6 +1394,7 @@ class TimePlannerApp(QWidget):
         layout.addWidget(self.info, alignment=Qt.AlignCenter)
         layout.addWidget(self.bar, alignment=Qt.AlignCenter)
         layout.addLayout(toolbar_row)
+        layout.addWidget(self.status_bar)
         self.setLayout(layout)
     # Entfernt: alles außerhalb von __init__ (Toolbar und Layout)
     
@@ -958,118 +1408,159 @@ class TimePlannerApp(QWidget):
         if dialog.exec_() == QDialog.Accepted:
             if dialog.delete_requested:
                 # Delete the section
-                self.bar.sections.pop(section_idx)
-                # Recalculate start times
-                cur = 0
-                for s in self.bar.sections:
-                    s.start = cur
-                    cur += s.duration
-                self.bar.update()
+                self.bar.remove_section(section_idx)
             else:
                 # Update the section
                 values = dialog.get_values()
-                if not values['name']:
-                    QMessageBox.warning(self, tr("error_title"), tr("error_empty_section_name"))
-                    return
-                
                 section.name = values['name']
                 section.duration = values['duration']
                 section.organisation = values['organisation']
                 section.explanation = values['explanation']
                 section.tools = values['tools']
                 
-                # Recalculate start times
-                cur = 0
-                for s in self.bar.sections:
-                    s.start = cur
-                    cur += s.duration
-                self.bar.update()
+                # Recalculate start times from the edited section on
+                self.bar.sections_changed(section_idx)
     
     def reset_plan(self):
-        from PyQt5.QtWidgets import QMessageBox
         reply = QMessageBox.question(self, tr("reset_title"), tr("reset_confirm"), QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            self.bar.sections.clear()
-            self.bar.update()
+            self.bar.clear_sections()
 
     def import_excel(self):
         """Optimized Excel import with better error handling"""
         path, _ = QFileDialog.getOpenFileName(self, tr("import_excel_title"), "", tr("excel_files_filter"))
-        if not path:
+        if not path or self._import_worker is not None:
             return
         
-        try:
-            pd = _import_pandas()
-            df = pd.read_excel(path, engine='openpyxl')  # Specify engine for better performance
-            
-            if df.empty:
-                QMessageBox.warning(self, tr("error_title"), "Excel file is empty")
-                return
-            
-            sections = []
-            cur_start = 0
-            
-            # Define column mappings for better compatibility
-            column_mappings = {
-                'name': ['Abschnitt', 'Section', 'Name'],
-                'duration': ['Dauer (min)', 'Duration (min)', 'Duration'],
-                'color': ['Farbe', 'Color'],
-                'organisation': ['Organisation', 'Organization'],
-                'explanation': ['Erklärung', 'Explanation'],
-                'tools': ['Hilfsmittel', 'Tools']
-            }
+        # Parse on the thread pool; the sections come back in one batch on the GUI thread
+        worker = ExcelImportWorker(path, self._read_excel_sections)
+        worker.signals.finished.connect(lambda sections: self._on_excel_imported(worker, path, sections))
+        worker.signals.failed.connect(lambda error: self._on_excel_import_failed(worker, error))
+        self._import_worker = worker
+        # Edits made meanwhile would be overwritten by the imported sections
+        self._update_plan_controls()
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _finish_import(self, worker):
+        """Unlock the plan after an import; False if the result belongs to no live import"""
+        # A closed window drops its import, and its widgets may already be gone
+        if worker is not self._import_worker:
+            return False
+        self._import_worker = None
+        QApplication.restoreOverrideCursor()
+        self._update_plan_controls()
+        return True
+    
+    def _update_plan_controls(self):
+        """Enable the bar and the plan-changing controls unless an import is running"""
+        enabled = self._import_worker is None
+        self.bar.setEnabled(enabled)
+        self.add_btn.setEnabled(enabled)
+        self.reset_btn.setEnabled(enabled)
+        for action in self._plan_actions:
+            action.setEnabled(enabled)
+    
+    def closeEvent(self, event):
+        # Forget a running import; its result arrives after this window is deleted
+        if self._import_worker is not None:
+            self._import_worker = None
+            QApplication.restoreOverrideCursor()
+        super().closeEvent(event)
+    
+    def _on_excel_imported(self, worker, path, sections):
+        """Apply the sections read by an ExcelImportWorker"""
+        if not self._finish_import(worker):
+            return
+        
+        if sections is None:
+            QMessageBox.warning(self, tr("error_title"), "Excel file is empty")
+            return
+        
+        if not sections:
+            QMessageBox.warning(self, tr("error_title"), "No valid sections found in Excel file")
+            return
+        
+        with self.bar.batch():
+            self.bar.replace_sections(sections)
+        QMessageBox.information(self, tr("import_success_title"), tr("import_success_message").format(path))
+    
+    def _on_excel_import_failed(self, worker, error):
+        """Report an error raised by an ExcelImportWorker"""
+        if not self._finish_import(worker):
+            return
+        
+        if isinstance(error, ImportError):
+            QMessageBox.warning(self, tr("error_title"), f"Required library not found: {error}")
+        else:
+            QMessageBox.warning(self, tr("error_title"), tr("import_error_message").format(str(error)))
+    
+    @staticmethod
+    def _read_excel_sections(worksheet):
+        """Build sections from the rows of a worksheet, or None if it has no header row"""
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return None
+        
+        # Define column mappings for better compatibility
+        column_mappings = {
+            'name': ['Abschnitt', 'Section', 'Name'],
+            'duration': ['Dauer (min)', 'Duration (min)', 'Duration'],
+            'color': ['Farbe', 'Color'],
+            'organisation': ['Organisation', 'Organization'],
+            'explanation': ['Erklärung', 'Explanation'],
+            'tools': ['Hilfsmittel', 'Tools']
+        }
+        
+        # Resolve column positions once per file
+        positions = {}
+        for idx, column in enumerate(header):
+            positions.setdefault(column, idx)
+        indices = {field: [positions[col] for col in columns if col in positions]
+                   for field, columns in column_mappings.items()}
+        
+        def cell(row, field, default):
+            # Missing values fall back to the next matching column, then to the default
+            for idx in indices[field]:
+                value = row[idx] if idx < len(row) else None
+                if value is not None:
+                    return value
+            return default
+        
+        sections = []
+        cur_start = 0
+        default_organisation = tr('organization_exercise')
+        color_cache = {}  # plans repeat a handful of colors, parse each one once
+        
+        for row in rows:
+            # Validate data
+            name = str(cell(row, 'name', '')).strip()
+            if not name:
+                continue  # Skip empty rows
             
-            for _, row in df.iterrows():
-                # Use helper function to get column value
-                name = self._get_column_value(row, column_mappings['name'], '')
-                duration = self._get_column_value(row, column_mappings['duration'], 0)
-                color_hex = self._get_column_value(row, column_mappings['color'], '#cccccc')
-                organisation = self._get_column_value(row, column_mappings['organisation'], tr('organization_exercise'))
-                explanation = self._get_column_value(row, column_mappings['explanation'], '')
-                tools = self._get_column_value(row, column_mappings['tools'], '')
-                
-                # Validate data
-                if not name.strip():
-                    continue  # Skip empty rows
-                
-                try:
-                    duration = int(duration)
-                    if duration <= 0:
-                        continue
-                except (ValueError, TypeError):
+            try:
+                duration = int(cell(row, 'duration', 0))
+                if duration <= 0:
                     continue
-                
-                # Validate color
-                try:
-                    color = QColor(color_hex)
-                    if not color.isValid():
-                        color = get_nice_color(len(sections))
-                except:
-                    color = get_nice_color(len(sections))
-                
-                sections.append(TimeSection(cur_start, duration, str(name).strip(), color, 
-                                          str(organisation), str(explanation), str(tools)))
-                cur_start += duration
-            
-            if not sections:
-                QMessageBox.warning(self, tr("error_title"), "No valid sections found in Excel file")
-                return
+            except (ValueError, TypeError):
+                continue
             
-            self.bar.sections = sections
-            self.bar.update()
-            QMessageBox.information(self, tr("import_success_title"), tr("import_success_message").format(path))
+            # Validate color
+            color_key = str(cell(row, 'color', '#cccccc'))
+            parsed = color_cache.get(color_key)
+            if parsed is None:
+                parsed = color_cache[color_key] = QColor(color_key)
+            # Copy so every section owns its color
+            color = QColor(parsed) if parsed.isValid() else get_nice_color(len(sections))
             
-        except ImportError as e:
-            QMessageBox.warning(self, tr("error_title"), f"Required library not found: {e}")
-        except Exception as e:
-            QMessageBox.warning(self, tr("error_title"), tr("import_error_message").format(str(e)))
-    
-    def _get_column_value(self, row, possible_columns, default):
-        """Helper to get column value with multiple possible column names"""
-        for col in possible_columns:
-            if col in row and pd.notna(row[col]):
-                return row[col]
-        return default
+            sections.append(TimeSection(cur_start, duration, name, color,
+                                        str(cell(row, 'organisation', default_organisation)),
+                                        str(cell(row, 'explanation', '')),
+                                        str(cell(row, 'tools', ''))))
+            cur_start += duration
+        
+        return sections
 
     def zoom_in(self):
         self.scale_factor = min(self.scale_factor + 0.1, 2.5)
@@ -1086,13 +1577,13 @@ class TimePlannerApp(QWidget):
         self.bar.setMinimumWidth(w)
         self.bar.setMinimumHeight(h)
         self.bar.resize(w, h)
+        self.bar.set_label_scale(self.scale_factor)
         font = self.title.font()
         font.setPointSize(int(22 * self.scale_factor))
         self.title.setFont(font)
         font2 = self.info.font()
         font2.setPointSize(int(14 * self.scale_factor))
         self.info.setFont(font2)
-        self.bar.update()
 
     def toggle_window_scaler(self):
         if self.isMaximized():
@@ -1101,12 +1592,22 @@ class TimePlannerApp(QWidget):
             self.showMaximized()
 
     def export_png(self):
-        from PyQt5.QtWidgets import QFileDialog, QMessageBox
         path, _ = QFileDialog.getSaveFileName(self, tr("export_png_title"), f"{self.plan_name}.png", tr("png_files_filter"))
         if not path:
             return
-        pixmap = self.bar.grab()
-        if pixmap.save(path, "PNG"):
+        # Render straight into a QImage; grab() would go through an extra QPixmap copy
+        dpr = self.bar.devicePixelRatioF()
+        image = QImage(int(self.bar.width() * dpr), int(self.bar.height() * dpr), QImage.Format_RGB32)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.white)
+        painter = QPainter(image)
+        self.bar.render(painter)
+        painter.end()
+        writer = QImageWriter(path, b"PNG")
+        # Qt's PNG compression option runs 0-100 and maps to zlib as value * 9 / 91, so 15 is
+        # zlib level 1: the flat colors of the bar still compress well, at a fraction of the time
+        writer.setCompression(15)
+        if writer.write(image):
             QMessageBox.information(self, tr("export_success_title"), tr("export_success_message").format(path))
         else:
             QMessageBox.warning(self, tr("error_title"), tr("export_error_message"))
@@ -1122,31 +1623,13 @@ class TimePlannerApp(QWidget):
             return
         
         try:
-            pd = _import_pandas()
-            
-            # Pre-allocate data list for better performance
-            data = []
-            # Note: Python lists don't have reserve, but we can still optimize
-            
-            for s in self.bar.sections:
-                # Use more efficient color formatting
-                color_hex = f'#{s.color.red():02x}{s.color.green():02x}{s.color.blue():02x}'
-                
-                data.append({
-                    tr('excel_column_section'): s.name,
-                    tr('excel_column_start'): s.start,
-                    tr('excel_column_duration'): s.duration,
-                    tr('excel_column_color'): color_hex,
-                    tr('excel_column_organization'): s.organisation,
-                    tr('excel_column_explanation'): s.explanation,
-                    tr('excel_column_tools'): s.tools
-                })
-            
-            df = pd.DataFrame(data)
-            
-            # Use efficient writer with optimizations
-            with pd.ExcelWriter(path, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Sections')
+            header = (tr('excel_column_section'), tr('excel_column_start'), tr('excel_column_duration'),
+                      tr('excel_column_color'), tr('excel_column_organization'),
+                      tr('excel_column_explanation'), tr('excel_column_tools'))
+            # Rows go straight to the writer, one tuple per section
+            rows = ((s.name, s.start, s.duration, s.color.name(), s.organisation, s.explanation, s.tools)
+                    for s in self.bar.sections)
+            _write_xlsx(path, 'Sections', header, rows)
             
             QMessageBox.information(self, tr("export_success_title"), tr("export_success_message").format(path))
             
@@ -1201,13 +1684,8 @@ class TimePlannerApp(QWidget):
     
     def _fill_docx_template(self, template_path, output_path, Document):
         """Optimized DOCX template filling with better performance"""
-        try:
-            from docx.shared import Pt
-        except ImportError:
-            # Fallback if docx.shared is not available
-            Pt = lambda x: x
-        
-        doc = Document(template_path)
+        # Every export gets a fresh Document, parsed from the cached template bytes
+        doc = Document(io.BytesIO(_read_template_bytes(template_path)))
         
         # Generate smart tools list from all sections
         tools_combined = self._combine_tools_intelligently()
@@ -1242,43 +1720,67 @@ class TimePlannerApp(QWidget):
             'Voraussetzungen:': tr('docx_template_voraussetzungen'),
             'Bezirksliga-Mannschaft/U18': tr('docx_template_default_team')
         }
+        # One alternation replaces the per-key loop. Longest keys come first so
+        # 'Hilfsmittel:' is translated as a label instead of as 'Hilfsmittel' + ':'
+        text_replacements = {**replacements, **template_text_replacements}
+        template_text_pattern = '|'.join(
+            map(re.escape, sorted(template_text_replacements, key=len, reverse=True)))
+        template_text_re = re.compile(template_text_pattern)
+        # Table cells get placeholders and template text in the same scan, so
+        # filled-in values (e.g. a theme called "Zeit") are not translated again
+        table_text_re = re.compile(f'{_PLACEHOLDER_RE.pattern}|{template_text_pattern}')
+        
+        def substitute(match):
+            key = match.group(0)
+            return text_replacements.get(key, key)  # unknown placeholders stay as they are
+        
+        def replace_text(paragraph, pattern):
+            text = paragraph.text
+            new_text = pattern.sub(substitute, text)
+            if new_text != text:
+                paragraph.text = new_text
+        
+        # Style ids already set to Calibri 14, shared by all paragraphs of this export
+        formatted_styles = set()
         
         # Replace in all table cells and apply font formatting
         for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        # Replace placeholders first
-                        for placeholder, value in replacements.items():
-                            if placeholder in paragraph.text:
-                                paragraph.text = paragraph.text.replace(placeholder, value)
-                        # Then replace template text for language support
-                        for german_text, translated_text in template_text_replacements.items():
-                            if german_text in paragraph.text:
-                                paragraph.text = paragraph.text.replace(german_text, translated_text)
-                        # Apply font formatting to all paragraphs
-                        self._apply_font_formatting(paragraph)
+            for paragraph in self._iter_table_paragraphs(table):
+                replace_text(paragraph, table_text_re)
+                # Apply font formatting to all paragraphs
+                self._apply_font_formatting(paragraph, formatted_styles)
         
         # Also apply font formatting and translations to regular paragraphs (not in tables)
         for paragraph in doc.paragraphs:
             # Apply template text translations to regular paragraphs too
-            for german_text, translated_text in template_text_replacements.items():
-                if german_text in paragraph.text:
-                    paragraph.text = paragraph.text.replace(german_text, translated_text)
-            self._apply_font_formatting(paragraph)
+            replace_text(paragraph, template_text_re)
+            self._apply_font_formatting(paragraph, formatted_styles)
         
         # Handle the sections table (Table 2)
         if len(doc.tables) >= 2:
             sections_table = doc.tables[1]  # Second table for sections
             
+            from docx.table import _Cell
+            
+            tbl = sections_table._tbl
+            template_tr = None
+            
             # Remove the existing template row (row 1, keep header row 0)
-            if len(sections_table.rows) > 1:
-                # Remove template row
-                sections_table._element.remove(sections_table.rows[1]._element)
+            if len(tbl.tr_lst) > 1:
+                # Keep it as the prototype so new rows inherit its cell formatting
+                template_tr = tbl.tr_lst[1]
+                tbl.remove(template_tr)
             
             # Add new rows for each section
             for i, section in enumerate(self.bar.sections):
-                row_cells = sections_table.add_row().cells
+                if template_tr is not None:
+                    # Appending a copied <w:tr> and wrapping its <w:tc>s directly avoids
+                    # add_row() and row.cells, which rebuild the whole table grid per row
+                    new_tr = deepcopy(template_tr)
+                    tbl.append(new_tr)
+                    row_cells = [_Cell(tc, sections_table) for tc in new_tr.tc_lst]
+                else:
+                    row_cells = sections_table.add_row().cells
                 if len(row_cells) >= 5:  # Ensure we have enough columns
                     # Format duration instead of time slot
                     duration_text = f"{section.duration} min"
@@ -1293,64 +1795,38 @@ class TimePlannerApp(QWidget):
                     # Apply font formatting to the new row
                     for cell in row_cells:
                         for paragraph in cell.paragraphs:
-                            self._apply_font_formatting(paragraph)
+                            self._apply_font_formatting(paragraph, formatted_styles)
         
         doc.save(output_path)
 
+    @staticmethod
+    def _iter_table_paragraphs(table):
+        """
+        Yield the paragraphs of every physical cell in a table
+        
+        table.rows[i].cells rebuilds the layout grid on each access and returns
+        merged cells once per spanned column; walking the underlying w:tc
+        elements visits every cell exactly once.
+        """
+        from docx.table import _Cell
+        
+        for tc in table._tbl.iter_tcs():
+            yield from _Cell(tc, table).paragraphs
+
     def _combine_tools_intelligently(self):
         """
         Optimized intelligent tool combination with better performance
         Example: "3 Balls", "6 Balls", "12 Balls" -> "12 Balls"
         """
-        import re
-        
-        if not self.bar.sections:
-            return tr('docx_no_tools')
-        
-        tool_quantities = {}  # tool_name -> max_quantity
-        
-        # Pre-compile regex for better performance
-        quantity_pattern = re.compile(r'^(\d+)\s+(.+)$')
-        
-        for section in self.bar.sections:
-            if not section.tools:
-                continue
-            
-            # Process tools more efficiently
-            tools_list = [tool.strip() for tool in section.tools.split(',') if tool.strip()]
-            
-            for tool in tools_list:
-                match = quantity_pattern.match(tool)
-                
-                if match:
-                    quantity = int(match.group(1))
-                    tool_name = match.group(2).strip()
-                    
-                    # Use dict.get for cleaner code
-                    tool_quantities[tool_name] = max(tool_quantities.get(tool_name, 0), quantity)
-                else:
-                    # No quantity found, treat as single item
-                    tool_name = tool
-                    if tool_name not in tool_quantities:
-                        tool_quantities[tool_name] = 0  # 0 means no quantity shown
-        
-        if not tool_quantities:
-            return tr('docx_no_tools')
-        
-        # Build final tools list efficiently
-        final_tools = []
-        for tool_name in sorted(tool_quantities.keys()):
-            quantity = tool_quantities[tool_name]
-            if quantity > 0:
-                final_tools.append(f"{quantity} {tool_name}")
-            else:
-                final_tools.append(tool_name)
-        
-        return ', '.join(final_tools)
+        return combine_tools(self.bar.sections)
 
-    def _apply_font_formatting(self, paragraph):
-        """Apply Calibri font with size 14 to all runs in a paragraph"""
-        from docx.shared import Pt
+    def _apply_font_formatting(self, paragraph, formatted_styles=None):
+        """Apply Calibri font with size 14 to all runs in a paragraph
+        
+        formatted_styles, if given, collects the style ids already formatted so
+        a style shared by many paragraphs is only written once.
+        """
+        font_size = _docx_font_size()
         
         # If paragraph has no runs but has text, we need to create a run
         if not paragraph.runs and paragraph.text:
@@ -1359,66 +1835,52 @@ class TimePlannerApp(QWidget):
             paragraph.clear()
             run = paragraph.add_run(text_content)
             run.font.name = 'Calibri'
-            run.font.size = Pt(14)
+            run.font.size = font_size
         else:
-            # Apply formatting to existing runs
+            # Apply formatting to existing runs, leaving runs that already match untouched
             for run in paragraph.runs:
-                if run.font:
+                # font.name writes both w:rFonts/@w:ascii and @w:hAnsi, so both must match
+                rPr = run._r.rPr
+                if (rPr is None or rPr.rFonts_ascii != 'Calibri' or rPr.rFonts_hAnsi != 'Calibri'
+                        or rPr.sz_val != font_size):
                     run.font.name = 'Calibri'
-                    run.font.size = Pt(14)
-                    
+                    run.font.size = font_size
+        
+        if formatted_styles is not None:
+            style_id = paragraph._p.style  # pStyle value, None for the default style
+            if style_id in formatted_styles:
+                return
+            formatted_styles.add(style_id)
+        
         # Ensure paragraph has the correct font style
-        if paragraph.style and hasattr(paragraph.style, 'font'):
-            paragraph.style.font.name = 'Calibri'
-            paragraph.style.font.size = Pt(14)
+        style = paragraph.style
+        if style and hasattr(style, 'font'):
+            style.font.name = 'Calibri'
+            style.font.size = font_size
 
     def _sanitize_filename(self, filename):
         """
         Optimized filename sanitization with better performance
         """
-        import re
-        
         if not filename:
             return 'Unknown'
         
-        # Pre-compile regex patterns for better performance
-        if not hasattr(self, '_filename_patterns'):
-            self._filename_patterns = {
-                'unsafe': re.compile(r'[<>:"/\\|?*]'),
-                'non_word': re.compile(r'[^\w\-_.]'),
-                'multiple_hyphens': re.compile(r'-+'),
-            }
-        
-        patterns = self._filename_patterns
-        
-        # Process in one pass for better performance
-        sanitized = filename.replace(' ', '-')
-        sanitized = patterns['unsafe'].sub('', sanitized)
-        sanitized = patterns['non_word'].sub('-', sanitized)
-        sanitized = patterns['multiple_hyphens'].sub('-', sanitized)
-        sanitized = sanitized.strip('-')
+        sanitized = _UNSAFE_FILENAME_RE.sub('', filename)
+        sanitized = _FILENAME_SEPARATOR_RE.sub('-', sanitized).strip('-')
         
         return sanitized if sanitized else 'Unknown'
 
     def add_section(self):
-        # Ermittle das Ende des letzten Segments
-        if self.bar.sections:
-            last = self.bar.sections[-1]
-            start = last.start + last.duration
-        else:
-            start = 0
-        max_duration = self.bar.total_minutes - start
+        # Ende des letzten Segments
+        start = self.bar.total_used
+        max_duration = self.bar.remaining_minutes
         if max_duration <= 0:
-            QMessageBox.warning(self, "Fehler", "Keine Zeit mehr verfügbar für weitere Abschnitte.")
+            self.status_bar.showMessage(tr("error_no_time_left"), 3000)
             return
         
         dialog = AddSectionDialog(max_duration, self)
         if dialog.exec_() == QDialog.Accepted:
             values = dialog.get_values()
-            if not values['name']:
-                QMessageBox.warning(self, tr("error_title"), tr("error_empty_section_name"))
-                return
-            
             color = get_nice_color(len(self.bar.sections))
             section = TimeSection(
                 start=start,
@@ -1429,8 +1891,7 @@ class TimePlannerApp(QWidget):
                 explanation=values['explanation'],
                 tools=values['tools']
             )
-            self.bar.sections.append(section)
-            self.bar.update()
+            self.bar.add_section(section)
     
     def update_language(self, language_code):
         """Update main application text when language changes"""
@@ -1479,6 +1940,9 @@ class TimePlannerApp(QWidget):
         reset_action.setShortcut("Ctrl+R")
         reset_action.triggered.connect(self.reset_plan)
         file_menu.addAction(reset_action)
+        # Actions that replace or change the plan are locked while an import runs
+        self._plan_actions = (import_excel_action, reset_action)
+        self._update_plan_controls()
         file_menu.addSeparator()
         scaler_action = QAction(tr("menu_window_size"), self)
         scaler_action.setShortcut("F11")
@@ -1521,7 +1985,14 @@ class TimePlannerApp(QWidget):
         self.update_menus()
 
 if __name__ == "__main__":
+    # High-DPI attributes only take effect when set before the QApplication exists
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    # Merge bursts of mouse-move and resize events into one per event-loop pass
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
     app = QApplication(sys.argv)
+    # Qt's built-in style instead of native theme drawing, identical on every platform
+    app.setStyle('Fusion')
     
     # Load settings to get language preference
     settings = AppSettings()
@@ -1532,6 +2003,18 @@ if __name__ == "__main__":
     # Language manager is not needed with simplified approach
     
     window = TimePlannerApp(settings)
+    # Destroy the window as soon as it closes, not during interpreter shutdown
+    window.setAttribute(Qt.WA_DeleteOnClose, True)
     window.resize(1500, 500)
     window.show()
-    sys.exit(app.exec_())
+    # Import openpyxl/python-docx in the background so neither startup nor the first export waits
+    QThreadPool.globalInstance().start(_PreloadWorker())
+    ret = app.exec_()
+    
+    # Let a still running import or preload finish before the interpreter shuts down
+    QThreadPool.globalInstance().waitForDone()
+    # Run the deleteLater() queued by the close, then drop the last Python references
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    _current_app_instance = None
+    del window
+    sys.exit(ret)
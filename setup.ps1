@@ -35,8 +35,8 @@ Write-Host "Environment created successfully!" -ForegroundColor Green
 Write-Host ""
 
 # Install conda packages
-Write-Host "Installing conda packages (pyqt, pyqtgraph, pandas, openpyxl)..." -ForegroundColor Yellow
-conda install -n zeitplan pyqt pyqtgraph pandas openpyxl -y
+Write-Host "Installing conda packages (pyqt, pyqtgraph, openpyxl)..." -ForegroundColor Yellow
+conda install -n zeitplan pyqt pyqtgraph openpyxl -y
 if ($LASTEXITCODE -ne 0) {
     Write-Host "ERROR: Failed to install conda packages." -ForegroundColor Red
     Read-Host "Press Enter to exit"
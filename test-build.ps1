@@ -80,12 +80,27 @@ try:
     color2 = main.get_nice_color(0)  # Should use cache
     print('Color caching: OK')
     
-    # Test lazy pandas import
+    # Test lazy openpyxl import
     try:
-        pd = main._import_pandas()
-        print('Lazy pandas import: OK')
+        openpyxl = main._import_openpyxl()
+        print('Lazy openpyxl import: OK')
+        
+        # Test the background Excel import on an exported file
+        import os, tempfile
+        from PyQt5.QtCore import Qt
+        path = os.path.join(tempfile.mkdtemp(), 'import-test.xlsx')
+        header = (tr('excel_column_section'), tr('excel_column_duration'), tr('excel_column_color'))
+        main._write_xlsx(path, 'Sections', header, [('Warm-up', 15, '#ff0000'), ('Game', 30, '#00ff00')])
+        worker = main.ExcelImportWorker(path, main.TimePlannerApp._read_excel_sections)
+        results = []
+        worker.signals.finished.connect(results.append, Qt.DirectConnection)
+        worker.signals.failed.connect(results.append, Qt.DirectConnection)
+        worker.run()
+        imported = [(s.start, s.duration, s.name, s.color.name()) for s in results[0]]
+        assert imported == [(0, 15, 'Warm-up', '#ff0000'), (15, 30, 'Game', '#00ff00')], results
+        print('Excel import worker: OK')
     except ImportError as e:
-        print(f'Lazy pandas import: MISSING - {e}')
+        print(f'Lazy openpyxl import: MISSING - {e}')
     
     # Test lazy docx import
     try:
@@ -4,6 +4,8 @@ Translation system for TimePlanner
 Provides easy-to-use translation functionality for multiple languages
 """
 
+from __future__ import annotations
+
 import json
 import os
 from typing import Dict, Optional
@@ -11,6 +13,8 @@ from typing import Dict, Optional
 
 class TranslationManager:
     """Optimized translation manager with caching and performance improvements"""
+    __slots__ = ('language', 'fallback_language', 'translations', 'fallback_translations',
+                 'lang_dir', '_resolved', '_fallback_loaded')
     
     # Class-level cache for loaded translations to avoid redundant file I/O
     _translation_cache: Dict[str, Dict[str, str]] = {}
@@ -27,20 +31,23 @@ class TranslationManager:
         self.fallback_language = fallback_language
         self.translations: Dict[str, str] = {}
         self.fallback_translations: Dict[str, str] = {}
+        self._fallback_loaded = False  # fallback catalog is only read on the first miss
         self.lang_dir = os.path.join(os.path.dirname(__file__), "lang")
         
         # Performance optimizations
-        self._missing_keys: set = set()  # Track missing keys to avoid repeated lookups
+        self._resolved: Dict[str, str] = {}  # key -> final text, including missing keys
         
         self.load_translations()
     
     def load_translations(self):
         """Load translation files"""
-        # Load primary language
+        # Load primary language; the fallback waits until a key is missing
         self._load_language_file(self.language, self.translations)
-        
-        # Load fallback language if different
-        if self.language != self.fallback_language:
+    
+    def _ensure_fallback_loaded(self):
+        """Load the fallback catalog on first use, if it differs from the primary one"""
+        if not self._fallback_loaded and self.language != self.fallback_language:
+            self._fallback_loaded = True
             self._load_language_file(self.fallback_language, self.fallback_translations)
     
     def _load_language_file(self, language: str, target_dict: Dict[str, str]):
@@ -82,22 +89,23 @@ class TranslationManager:
         Returns:
             Translated and formatted string
         """
-        # Quick check for missing keys to avoid repeated lookups
-        if key in self._missing_keys:
-            text = key
-        else:
+        # Resolved keys (and known-missing ones) skip the primary/fallback lookup
+        text = self._resolved.get(key)
+        if text is None:
             # Try primary language first
             text = self.translations.get(key)
             
             # Fall back to fallback language
-            if text is None and self.fallback_translations:
+            if text is None:
+                self._ensure_fallback_loaded()
                 text = self.fallback_translations.get(key)
             
-            # If still not found, cache as missing and return key
+            # If still not found, return the key (reported only once)
             if text is None:
                 text = key
-                self._missing_keys.add(key)
                 print(f"Translation missing: {key}")
+            
+            self._resolved[key] = text
         
         # Apply formatting if arguments provided
         if kwargs:
@@ -119,7 +127,7 @@ class TranslationManager:
         if language != self.language:
             self.language = language
             self.translations.clear()
-            self._missing_keys.clear()  # Clear missing keys cache
+            self._resolved.clear()  # Resolved texts belong to the old language
             self.load_translations()
     
     def get_available_languages(self) -> list: